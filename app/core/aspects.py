@@ -8,6 +8,17 @@ from app.models.chart import Aspect, AspectPair, PlanetPosition
 from app.core.config_loader import config_loader
 
 
+def angular_diff(lon1: float, lon2: float) -> float:
+    """
+    Absolute angular separation of two longitudes (0-180)
+
+    Branchless modular form of the usual "if diff > 180: diff = 360 -
+    diff" wrap; also robust for inputs outside [0, 360) such as the
+    speed-projected positions in is_applying.
+    """
+    return abs(((lon1 - lon2 + 540.0) % 360.0) - 180.0)
+
+
 def find_aspect_between(
     lon1: float,
     lon2: float,
@@ -37,9 +48,7 @@ def find_aspect_between(
     orb_multipliers = config_loader.get_orb_multipliers()
 
     # Calculate angular difference
-    diff = abs(lon1 - lon2)
-    if diff > 180:
-        diff = 360 - diff
+    diff = angular_diff(lon1, lon2)
 
     # Apply orb multipliers for luminaries
     final_orb_mult = orb_multiplier
@@ -94,18 +103,10 @@ def is_applying(
         True if applying, False if separating
     """
     # Calculate current angular distance
-    current_diff = abs(lon1 - lon2)
-    if current_diff > 180:
-        current_diff = 360 - current_diff
-
-    # Calculate future positions (1 day ahead)
-    future_lon1 = lon1 + speed1
-    future_lon2 = lon2 + speed2
+    current_diff = angular_diff(lon1, lon2)
 
-    # Calculate future angular distance
-    future_diff = abs(future_lon1 - future_lon2)
-    if future_diff > 180:
-        future_diff = 360 - future_diff
+    # Calculate future angular distance (positions 1 day ahead)
+    future_diff = angular_diff(lon1 + speed1, lon2 + speed2)
 
     # Current exactness vs exact aspect angle
     current_exactness = abs(current_diff - aspect_angle)
@@ -170,6 +171,9 @@ def find_all_aspects(
                     aspect=aspect
                 ))
 
+    # Strongest first: every consumer (markdown tables, AI prompts)
+    # wants this order, so sort once here instead of per export
+    aspects.sort(key=lambda ap: ap.aspect.strength, reverse=True)
     return aspects
 
 
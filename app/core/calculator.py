@@ -3,23 +3,157 @@ Core Chart Calculator
 High-level chart calculation orchestration
 """
 
+import functools
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Dict, Optional
+
+import numpy as np
+import swisseph as swe
 from app.models.chart import (
-    NatalChart, BirthData, Location, PlanetPosition,
-    HouseData, AspectPair, Pattern
+    NatalChart, MultiHouseNatalChart, BirthData, Location, PlanetPosition,
+    HouseData, AspectPair, Pattern, TransitChart, TransitData,
+    ProgressedChart, SolarReturnChart
 )
-from app.core.ephemeris import ephemeris
+from app.core.ephemeris import ephemeris, datetime_to_julian_fast
 from app.core.celestial_bodies import (
-    get_celestial_bodies_to_calculate,
+    get_celestial_body_items,
     get_calculated_points,
     get_fixed_stars,
-    longitude_to_sign
+    longitude_to_sign,
+    longitudes_to_signs
 )
-from app.core.aspects import find_all_aspects, detect_patterns
+from app.core.aspects import find_all_aspects, find_transiting_aspects, detect_patterns
 from app.core.config_loader import config_loader
 
+# Calculation flags shared by the batched body sweep
+_CALC_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+try:
+    # Numba is optional - the pure-Python kernel below works without it
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _newton_return_step(jd: float, lon: float, speed: float, target_lon: float) -> tuple:
+    """
+    One Newton-Raphson step of the return search (pure arithmetic)
+
+    Computes the signed wrapped delta to the target longitude and the
+    next jd estimate. Leaves jd unchanged when the body is stationary
+    or retrograde (speed <= 0), signalling the caller to bail out.
+    Kept free of ephemeris calls so Numba can compile it when present.
+
+    Returns:
+        Tuple of (delta_degrees, next_jd)
+    """
+    delta = ((target_lon - lon + 540.0) % 360.0) - 180.0
+    if speed > 0.0:
+        jd += delta / speed
+    return delta, jd
+
+
+if njit is not None:
+    _newton_return_step = njit(cache=True)(_newton_return_step)
+
+
+def _fast_pp(
+    name: str,
+    longitude: float,
+    latitude: float,
+    distance: float,
+    speed: float,
+    sign: str,
+    sign_symbol: str,
+    degree: float,
+    house: int,
+    retrograde: bool
+) -> PlanetPosition:
+    """
+    Build a PlanetPosition from trusted ephemeris output
+
+    Uses model_construct to skip Pydantic field validation - the values
+    come straight from Swiss Ephemeris and our own sign/house math, so
+    re-validating every field per body per chart is pure overhead.
+    Request-supplied data must keep going through the validating
+    constructor.
+    """
+    return PlanetPosition.model_construct(
+        name=name,
+        longitude=longitude,
+        latitude=latitude,
+        distance=distance,
+        speed=speed,
+        sign=sign,
+        sign_symbol=sign_symbol,
+        degree=degree,
+        house=house,
+        retrograde=retrograde
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _calculate_houses_raw(jd: float, latitude: float, longitude: float, system_code: bytes) -> tuple:
+    """
+    Cached Swiss Ephemeris house computation keyed by primitives
+
+    Transits, progressions, and multi-system charts frequently repeat
+    the exact same (jd, location, system) computation; caching by the
+    hashable primitives avoids redundant swe.houses calls. Returns
+    immutable (cusps, ascmc) tuples so cached results cannot be
+    mutated by callers.
+    """
+    cusps, ascmc = ephemeris.calculate_houses(jd, latitude, longitude, system_code)
+    return tuple(cusps), tuple(ascmc)
+
+
+class PlanetTable:
+    """
+    Struct-of-arrays view of the bodies calculated for one chart
+
+    Parallel NumPy arrays keep longitudes, speeds, etc. contiguous so
+    vectorized consumers (house lookup, derived points, aspect math)
+    can operate on columns instead of iterating PlanetPosition objects.
+    The Dict[str, PlanetPosition] stays the API-facing representation.
+    """
+
+    __slots__ = ("names", "lon", "lat", "dist", "speed", "house", "sign_idx")
+
+    def __init__(
+        self,
+        names: list,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        dist: np.ndarray,
+        speed: np.ndarray,
+        house: np.ndarray,
+        sign_idx: np.ndarray
+    ):
+        self.names = names
+        self.lon = lon
+        self.lat = lat
+        self.dist = dist
+        self.speed = speed
+        self.house = house
+        self.sign_idx = sign_idx
+
+    @property
+    def retrograde(self) -> np.ndarray:
+        """Boolean retrograde flags (negative daily motion)"""
+        return self.speed < 0
+
+    def pairwise_separations(self) -> np.ndarray:
+        """
+        (N, N) matrix of absolute angular separations (0-180)
+
+        One broadcast instead of N^2 scalar angular_diff calls - the
+        input grid for vectorized aspect detection.
+        """
+        diff = np.abs(self.lon[:, None] - self.lon[None, :])
+        return np.minimum(diff, 360.0 - diff)
+
 
 class ChartCalculator:
     """Main chart calculation engine"""
@@ -51,19 +185,18 @@ class ChartCalculator:
         Returns:
             NatalChart or MultiHouseNatalChart object
         """
-        from app.models.chart import MultiHouseNatalChart
-
         # Convert to Julian Day
-        jd = ephemeris.datetime_to_julian(datetime_utc)
+        jd = datetime_to_julian_fast(datetime_utc)
 
-        # Create location and birth data
-        location = Location(
+        # Create location and birth data. Inputs were already validated
+        # by the API request model, so skip re-validation here
+        location = Location.model_construct(
             latitude=latitude,
             longitude=longitude,
             name=location_name
         )
 
-        birth_data = BirthData(
+        birth_data = BirthData.model_construct(
             datetime_utc=datetime_utc,
             location=location,
             julian_day=jd
@@ -81,7 +214,7 @@ class ChartCalculator:
         house_data = self._calculate_houses(jd, latitude, longitude, house_system)
 
         # Calculate all celestial bodies
-        planets = self._calculate_all_bodies(jd, house_data.cusps)
+        planets, planet_table = self._calculate_all_bodies(jd, house_data.cusps)
 
         # Calculate Part of Fortune and other calculated points
         self._add_calculated_points(planets, house_data, house_data.cusps)
@@ -108,23 +241,26 @@ class ChartCalculator:
         birth_data: BirthData
     ):
         """Calculate chart with all house systems"""
-        from app.models.chart import MultiHouseNatalChart
-
-        # Get all house systems
-        house_systems = config_loader.get_house_systems()
-
-        # Calculate all house systems
-        all_houses = {}
-        for system_name in house_systems.keys():
-            house_data = self._calculate_houses(jd, latitude, longitude, system_name)
-            all_houses[system_name] = house_data
+        # Pre-resolved {system_name: code} mapping (pre-encoded bytes),
+        # built once in config
+        system_codes = config_loader.get_house_system_codes_bytes()
+
+        # Calculate all house systems concurrently - each system is
+        # independent and swe.houses releases the GIL in C, so the ~10
+        # computations overlap (ephemeris path is set once at startup)
+        with ThreadPoolExecutor(max_workers=min(8, len(system_codes))) as executor:
+            futures = {
+                name: executor.submit(self._calculate_houses_by_code, jd, latitude, longitude, name, code)
+                for name, code in system_codes.items()
+            }
+            all_houses = {name: future.result() for name, future in futures.items()}
 
         # Use first house system (Placidus by default) for planet positions
         default_system = config_loader.get_house_system_default()
         default_cusps = all_houses[default_system].cusps
 
         # Calculate all celestial bodies
-        planets = self._calculate_all_bodies(jd, default_cusps)
+        planets, planet_table = self._calculate_all_bodies(jd, default_cusps)
 
         # Calculate Part of Fortune and other calculated points
         self._add_calculated_points(planets, all_houses[default_system], default_cusps)
@@ -147,37 +283,60 @@ class ChartCalculator:
         self,
         jd: float,
         house_cusps: list
-    ) -> Dict[str, PlanetPosition]:
-        """Calculate all celestial bodies"""
+    ) -> tuple[Dict[str, PlanetPosition], PlanetTable]:
+        """Calculate all celestial bodies; returns (dict, SoA table)"""
         planets = {}
 
-        # Get bodies to calculate from config
-        bodies_map = get_celestial_bodies_to_calculate()
-
-        for body_name, body_id in bodies_map.items():
+        # Get bodies to calculate from config (frozen tuple, cached)
+        body_items = get_celestial_body_items()
+
+        # Single tight ephemeris sweep: all bodies share jd and flags, so
+        # collect the raw (lon, lat, dist, speed) rows into one buffer and
+        # vectorize the sign/degree math instead of doing it per body
+        names = []
+        raw = np.empty((len(body_items), 4))
+        count = 0
+        calc_ut = swe.calc_ut
+        for body_name, body_id in body_items:
             try:
-                lon, lat, dist, speed = ephemeris.calculate_planet_position(jd, body_id)
-
-                sign, sign_symbol, degree = longitude_to_sign(lon)
-                house = ephemeris.get_house_position(lon, house_cusps)
-                retrograde = speed < 0
-
-                planets[body_name] = PlanetPosition(
-                    name=body_name,
-                    longitude=round(lon, 4),
-                    latitude=round(lat, 4),
-                    distance=round(dist, 6),
-                    speed=round(speed, 6),
-                    sign=sign,
-                    sign_symbol=sign_symbol,
-                    degree=round(degree, 2),
-                    house=house,
-                    retrograde=retrograde
-                )
-
+                result, _ = calc_ut(jd, body_id, _CALC_FLAGS)
             except Exception as e:
                 logging.getLogger("xinis.calculator").warning("Could not calculate %s: %s", body_name, e)
                 continue
+            raw[count] = result[:4]
+            names.append(body_name)
+            count += 1
+        raw = raw[:count]
+
+        lons = raw[:, 0]
+        signs, sign_symbols, degrees = longitudes_to_signs(lons)
+        houses = ephemeris.get_house_positions(lons, house_cusps)
+
+        table = PlanetTable(
+            names=names,
+            lon=lons,
+            lat=raw[:, 1],
+            dist=raw[:, 2],
+            speed=raw[:, 3],
+            house=houses.astype(np.int8),
+            sign_idx=((lons // 30).astype(np.int8) % 12)
+        )
+
+        for i, body_name in enumerate(names):
+            lon, lat, dist, speed = raw[i]
+
+            planets[body_name] = _fast_pp(
+                body_name,
+                float(lon),
+                float(lat),
+                float(dist),
+                float(speed),
+                str(signs[i]),
+                str(sign_symbols[i]),
+                float(degrees[i]),
+                int(houses[i]),
+                bool(speed < 0)
+            )
 
         # Calculate fixed stars if enabled
         fixed_stars = get_fixed_stars()
@@ -188,23 +347,23 @@ class ChartCalculator:
                     sign, sign_symbol, degree = longitude_to_sign(lon)
                     house = ephemeris.get_house_position(lon, house_cusps)
 
-                    planets[star_name] = PlanetPosition(
-                        name=star_name,
-                        longitude=round(lon, 4),
-                        latitude=round(lat, 4),
-                        distance=0.0,
-                        speed=0.0,
-                        sign=sign,
-                        sign_symbol=sign_symbol,
-                        degree=round(degree, 2),
-                        house=house,
-                        retrograde=False
+                    planets[star_name] = _fast_pp(
+                        star_name,
+                        lon,
+                        lat,
+                        0.0,
+                        0.0,
+                        sign,
+                        sign_symbol,
+                        degree,
+                        house,
+                        False
                     )
             except Exception as e:
                 logging.getLogger("xinis.calculator").warning("Could not calculate fixed star %s: %s", star_name, e)
                 continue
 
-        return planets
+        return planets, table
 
     def _calculate_houses(
         self,
@@ -214,18 +373,21 @@ class ChartCalculator:
         house_system: str
     ) -> HouseData:
         """Calculate house cusps"""
-        # Get house system code
-        house_systems = config_loader.get_house_systems()
-        system_data = house_systems.get(house_system, {})
+        # Resolve system name to pre-encoded code via the cached mapping
+        system_code = config_loader.get_house_system_codes_bytes().get(house_system, b"P")
 
-        # Handle both old format (string) and new format (dict)
-        if isinstance(system_data, dict):
-            system_code = system_data.get("code", "P")
-        else:
-            system_code = system_data
+        return self._calculate_houses_by_code(jd, latitude, longitude, house_system, system_code)
 
-        # Calculate houses
-        cusps, ascmc = ephemeris.calculate_houses(jd, latitude, longitude, system_code)
+    def _calculate_houses_by_code(
+        self,
+        jd: float,
+        latitude: float,
+        longitude: float,
+        house_system: str,
+        system_code: bytes
+    ) -> HouseData:
+        """Calculate house cusps with the system code already resolved"""
+        cusps, ascmc = _calculate_houses_raw(jd, latitude, longitude, system_code)
 
         # Extract important points
         ascendant = ascmc[0]
@@ -235,13 +397,63 @@ class ChartCalculator:
 
         return HouseData(
             system=house_system,
-            cusps=cusps[1:13] if len(cusps) > 12 else cusps[:12],
-            ascendant=round(ascendant, 4),
-            mc=round(mc, 4),
-            vertex=round(vertex, 4),
-            equatorial_ascendant=round(eq_asc, 4) if eq_asc else None
+            cusps=list(cusps[1:13] if len(cusps) > 12 else cusps[:12]),
+            ascendant=ascendant,
+            mc=mc,
+            vertex=vertex,
+            equatorial_ascendant=eq_asc if eq_asc else None
         )
 
+    def _calculate_houses_many(
+        self,
+        jds,
+        latitude: float,
+        longitude: float,
+        house_system: str
+    ) -> tuple:
+        """
+        Calculate house cusps for a whole series of Julian Days at once
+
+        Transit streams re-derive houses for the same location at many
+        timestamps; this fills preallocated (T, 12) cusp and (T, k)
+        ascmc arrays, running the independent swe.houses calls through
+        the same thread pool used for the multi-system path (the C
+        calls release the GIL).
+
+        Args:
+            jds: Array-like of Julian Day Numbers
+            latitude: Observer latitude
+            longitude: Observer longitude
+            house_system: House system name (e.g. "Placidus")
+
+        Returns:
+            Tuple of (cusps, ascmc) arrays with one row per input jd
+        """
+        system_code = config_loader.get_house_system_codes_bytes().get(house_system, b"P")
+        jds = np.asarray(jds, dtype=np.float64)
+        n = len(jds)
+
+        if n == 0:
+            return np.empty((0, 12)), np.empty((0, 0))
+
+        # First row sizes the ascmc buffer (length is backend-dependent)
+        first_cusps, first_ascmc = _calculate_houses_raw(float(jds[0]), latitude, longitude, system_code)
+        cusps_out = np.empty((n, 12))
+        ascmc_out = np.empty((n, len(first_ascmc)))
+        cusps_out[0] = first_cusps[1:13] if len(first_cusps) > 12 else first_cusps[:12]
+        ascmc_out[0] = first_ascmc
+
+        def fill_row(i: int):
+            cusps, ascmc = _calculate_houses_raw(float(jds[i]), latitude, longitude, system_code)
+            cusps_out[i] = cusps[1:13] if len(cusps) > 12 else cusps[:12]
+            ascmc_out[i] = ascmc
+
+        if n > 1:
+            with ThreadPoolExecutor(max_workers=min(8, n - 1)) as executor:
+                list(executor.map(fill_row, range(1, n)))
+
+        return cusps_out, ascmc_out
+
     def _add_calculated_points(
         self,
         planets: Dict[str, PlanetPosition],
@@ -251,56 +463,46 @@ class ChartCalculator:
         """Add calculated points (Part of Fortune, etc.)"""
         calculated_points = get_calculated_points()
 
-        if "Part_of_Fortune" in calculated_points:
-            if "Sun" in planets and "Moon" in planets:
-                sun_lon = planets["Sun"].longitude
-                moon_lon = planets["Moon"].longitude
-                asc_lon = house_data.ascendant
+        # Collect derived longitudes first, then run sign/house math for
+        # all of them in the same vectorized pass used for real bodies
+        derived = []
 
-                # Determine if day or night birth
-                is_day = ephemeris.is_day_birth(sun_lon, asc_lon)
-
-                # Calculate Part of Fortune
-                pof_lon = ephemeris.calculate_part_of_fortune(
-                    asc_lon, sun_lon, moon_lon, is_day
-                )
-
-                sign, sign_symbol, degree = longitude_to_sign(pof_lon)
-                house = ephemeris.get_house_position(pof_lon, house_cusps)
-
-                planets["Part_of_Fortune"] = PlanetPosition(
-                    name="Part_of_Fortune",
-                    longitude=round(pof_lon, 4),
-                    latitude=0.0,
-                    distance=0.0,
-                    speed=0.0,
-                    sign=sign,
-                    sign_symbol=sign_symbol,
-                    degree=round(degree, 2),
-                    house=house,
-                    retrograde=False
+        if "Part_of_Fortune" in calculated_points:
+            sun = planets.get("Sun")
+            moon = planets.get("Moon")
+            if sun is not None and moon is not None:
+                # Fused day/night + formula in one ephemeris call
+                pof_lon = ephemeris.calculate_part_of_fortune_auto(
+                    house_data.ascendant, sun.longitude, moon.longitude
                 )
+                derived.append(("Part_of_Fortune", pof_lon, 0.0))
 
         if "South_Node" in calculated_points:
-            if "True_Node" in planets:
-                north_node_lon = planets["True_Node"].longitude
-                south_node_lon = (north_node_lon + 180) % 360
-
-                sign, sign_symbol, degree = longitude_to_sign(south_node_lon)
-                house = ephemeris.get_house_position(south_node_lon, house_cusps)
-
-                planets["South_Node"] = PlanetPosition(
-                    name="South_Node",
-                    longitude=round(south_node_lon, 4),
-                    latitude=0.0,
-                    distance=0.0,
-                    speed=-planets["True_Node"].speed,
-                    sign=sign,
-                    sign_symbol=sign_symbol,
-                    degree=round(degree, 2),
-                    house=house,
-                    retrograde=False
-                )
+            north_node = planets.get("True_Node")
+            if north_node is not None:
+                south_node_lon = (north_node.longitude + 180) % 360
+                derived.append(("South_Node", south_node_lon, -north_node.speed))
+
+        if not derived:
+            return
+
+        lons = np.array([lon for _, lon, _ in derived])
+        signs, sign_symbols, degrees = longitudes_to_signs(lons)
+        houses = ephemeris.get_house_positions(lons, house_cusps)
+
+        for i, (point_name, lon, speed) in enumerate(derived):
+            planets[point_name] = _fast_pp(
+                point_name,
+                lon,
+                0.0,
+                0.0,
+                speed,
+                str(signs[i]),
+                str(sign_symbols[i]),
+                float(degrees[i]),
+                int(houses[i]),
+                False
+            )
 
     def calculate_transit_chart(
         self,
@@ -323,9 +525,6 @@ class ChartCalculator:
         Returns:
             TransitChart object
         """
-        from app.models.chart import TransitChart, TransitData
-        from app.core.aspects import find_transiting_aspects
-
         # Use natal location if transit location not specified
         if transit_latitude is None:
             transit_latitude = natal_chart.birth_data.location.latitude
@@ -333,7 +532,7 @@ class ChartCalculator:
             transit_longitude = natal_chart.birth_data.location.longitude
 
         # Calculate transit positions
-        jd = ephemeris.datetime_to_julian(transit_datetime)
+        jd = datetime_to_julian_fast(transit_datetime)
 
         # Use specified house system or natal's system
         target_house_system = house_system if house_system else natal_chart.houses.system
@@ -344,7 +543,7 @@ class ChartCalculator:
             target_house_system
         )
 
-        transit_planets = self._calculate_all_bodies(jd, house_data.cusps)
+        transit_planets, _ = self._calculate_all_bodies(jd, house_data.cusps)
 
         # Find transit-to-natal aspects
         transit_aspects = find_transiting_aspects(
@@ -354,7 +553,7 @@ class ChartCalculator:
 
         transit_data = TransitData(
             transit_date=transit_datetime,
-            transit_location=Location(
+            transit_location=Location.model_construct(
                 latitude=transit_latitude,
                 longitude=transit_longitude
             ),
@@ -384,20 +583,16 @@ class ChartCalculator:
         Returns:
             ProgressedChart object
         """
-        from app.models.chart import ProgressedChart
-        from app.core.aspects import find_transiting_aspects
-
         # Calculate progression
         birth_dt = natal_chart.birth_data.datetime_utc
         years_elapsed = (progression_date - birth_dt).days / 365.25
 
         # Secondary progression: 1 day = 1 year
         # So add years_elapsed days to birth date
-        from datetime import timedelta
         progressed_dt = birth_dt + timedelta(days=years_elapsed)
 
         # Calculate progressed positions
-        jd = ephemeris.datetime_to_julian(progressed_dt)
+        jd = datetime_to_julian_fast(progressed_dt)
 
         # Use natal location and house system
         natal_lat = natal_chart.birth_data.location.latitude
@@ -413,7 +608,7 @@ class ChartCalculator:
         )
 
         # Calculate progressed planets
-        progressed_planets = self._calculate_all_bodies(jd, house_data.cusps)
+        progressed_planets, _ = self._calculate_all_bodies(jd, house_data.cusps)
 
         # Find progressed-to-natal aspects
         progressed_aspects = find_transiting_aspects(
@@ -452,8 +647,6 @@ class ChartCalculator:
         Returns:
             SolarReturnChart object
         """
-        from app.models.chart import SolarReturnChart
-
         # Get natal Sun position
         natal_sun_lon = natal_chart.planets["Sun"].longitude
 
@@ -475,7 +668,7 @@ class ChartCalculator:
         return_datetime = self._find_sun_return(search_dt, natal_sun_lon, precision)
 
         # Calculate chart for return moment
-        jd = ephemeris.datetime_to_julian(return_datetime)
+        jd = datetime_to_julian_fast(return_datetime)
 
         # Use specified house system or natal's system
         target_house_system = house_system if house_system else natal_chart.houses.system
@@ -486,13 +679,13 @@ class ChartCalculator:
             target_house_system
         )
 
-        return_planets = self._calculate_all_bodies(jd, house_data.cusps)
+        return_planets, _ = self._calculate_all_bodies(jd, house_data.cusps)
 
         return SolarReturnChart(
             natal_chart=natal_chart,
             return_year=return_year,
             return_datetime=return_datetime,
-            return_location=Location(
+            return_location=Location.model_construct(
                 latitude=return_location_latitude,
                 longitude=return_location_longitude,
                 name=location_name
@@ -524,8 +717,6 @@ class ChartCalculator:
         Returns:
             SolarReturnChart object (reused for lunar returns)
         """
-        from app.models.chart import SolarReturnChart
-
         # Get natal Moon position
         natal_moon_lon = natal_chart.planets["Moon"].longitude
 
@@ -542,7 +733,7 @@ class ChartCalculator:
         return_datetime = self._find_moon_return(return_date, natal_moon_lon, precision)
 
         # Calculate chart for return moment
-        jd = ephemeris.datetime_to_julian(return_datetime)
+        jd = datetime_to_julian_fast(return_datetime)
 
         # Use specified house system or natal's system
         target_house_system = house_system if house_system else natal_chart.houses.system
@@ -553,13 +744,13 @@ class ChartCalculator:
             target_house_system
         )
 
-        return_planets = self._calculate_all_bodies(jd, house_data.cusps)
+        return_planets, _ = self._calculate_all_bodies(jd, house_data.cusps)
 
         return SolarReturnChart(
             natal_chart=natal_chart,
             return_year=return_date.year,
             return_datetime=return_datetime,
-            return_location=Location(
+            return_location=Location.model_construct(
                 latitude=return_location_latitude,
                 longitude=return_location_longitude,
                 name=location_name
@@ -575,55 +766,7 @@ class ChartCalculator:
         precision: float
     ) -> datetime:
         """Find exact moment when Sun returns to target longitude"""
-        from datetime import timedelta
-
-        # Search in 1-hour increments, then refine
-        search_dt = approximate_date - timedelta(days=2)
-        end_dt = approximate_date + timedelta(days=2)
-
-        best_dt = search_dt
-        best_diff = 360.0
-
-        # Coarse search (hourly)
-        current_dt = search_dt
-        while current_dt <= end_dt:
-            jd = ephemeris.datetime_to_julian(current_dt)
-            sun_lon, _, _, _ = ephemeris.calculate_planet_position(jd, 0)
-
-            diff = abs(sun_lon - target_longitude)
-            if diff > 180:
-                diff = 360 - diff
-
-            if diff < best_diff:
-                best_diff = diff
-                best_dt = current_dt
-
-            current_dt += timedelta(hours=1)
-
-        # Fine search (minute)
-        search_dt = best_dt - timedelta(hours=2)
-        end_dt = best_dt + timedelta(hours=2)
-        best_diff = 360.0
-
-        current_dt = search_dt
-        while current_dt <= end_dt:
-            jd = ephemeris.datetime_to_julian(current_dt)
-            sun_lon, _, _, _ = ephemeris.calculate_planet_position(jd, 0)
-
-            diff = abs(sun_lon - target_longitude)
-            if diff > 180:
-                diff = 360 - diff
-
-            if diff < best_diff:
-                best_diff = diff
-                best_dt = current_dt
-
-            if diff < precision:
-                return best_dt
-
-            current_dt += timedelta(minutes=1)
-
-        return best_dt
+        return self._find_return(approximate_date, target_longitude, 0, precision)
 
     def _find_moon_return(
         self,
@@ -632,54 +775,95 @@ class ChartCalculator:
         precision: float
     ) -> datetime:
         """Find exact moment when Moon returns to target longitude"""
-        from datetime import timedelta
-
-        search_dt = approximate_date - timedelta(days=2)
-        end_dt = approximate_date + timedelta(days=2)
+        return self._find_return(approximate_date, target_longitude, 1, precision)
 
-        best_dt = search_dt
-        best_diff = 360.0
-
-        # Coarse search (hourly)
-        current_dt = search_dt
-        while current_dt <= end_dt:
-            jd = ephemeris.datetime_to_julian(current_dt)
-            moon_lon, _, _, _ = ephemeris.calculate_planet_position(jd, 1)
+    def _find_return(
+        self,
+        approximate_date: datetime,
+        target_longitude: float,
+        body_id: int,
+        precision: float
+    ) -> datetime:
+        """
+        Find moment when a body returns to target longitude (Newton-Raphson)
 
-            diff = abs(moon_lon - target_longitude)
-            if diff > 180:
-                diff = 360 - diff
+        Uses the body's instantaneous speed from the ephemeris to step
+        directly toward the return: jd += wrapped_delta / speed.
+        Converges in a handful of iterations for the always-direct Sun/Moon
+        instead of scanning hundreds of probe points. Falls back to
+        bisection over a bracketing window if the iteration fails to
+        converge (e.g. near a station for other bodies).
 
-            if diff < best_diff:
-                best_diff = diff
-                best_dt = current_dt
+        Args:
+            approximate_date: Starting guess (UTC)
+            target_longitude: Longitude the body must return to (0-360)
+            body_id: Swiss Ephemeris body constant (0=Sun, 1=Moon)
+            precision: Acceptable longitude error in degrees
 
-            current_dt += timedelta(hours=1)
+        Returns:
+            Datetime of the return moment (UTC)
+        """
+        jd = datetime_to_julian_fast(approximate_date)
 
-        # Fine search (5 minutes)
-        search_dt = best_dt - timedelta(hours=2)
-        end_dt = best_dt + timedelta(hours=2)
-        best_diff = 360.0
+        for _ in range(10):
+            lon, _, _, speed = ephemeris.calculate_planet_position(jd, body_id)
 
-        current_dt = search_dt
-        while current_dt <= end_dt:
-            jd = ephemeris.datetime_to_julian(current_dt)
-            moon_lon, _, _, _ = ephemeris.calculate_planet_position(jd, 1)
+            delta, next_jd = _newton_return_step(jd, lon, speed, target_longitude)
 
-            diff = abs(moon_lon - target_longitude)
-            if diff > 180:
-                diff = 360 - diff
+            if abs(delta) < precision:
+                return ephemeris.julian_to_datetime(jd)
 
-            if diff < best_diff:
-                best_diff = diff
-                best_dt = current_dt
+            if next_jd == jd:
+                # Retrograde/stationary - Newton step unreliable
+                break
 
-            if diff < precision:
-                return best_dt
+            jd = next_jd
 
-            current_dt += timedelta(minutes=5)
+        return self._find_return_bisection(
+            datetime_to_julian_fast(approximate_date),
+            target_longitude,
+            body_id,
+            precision
+        )
 
-        return best_dt
+    def _find_return_bisection(
+        self,
+        jd_center: float,
+        target_longitude: float,
+        body_id: int,
+        precision: float
+    ) -> datetime:
+        """Bisection fallback for return search over a +/-2 day bracket"""
+        def signed_delta(jd: float) -> float:
+            lon, _, _, _ = ephemeris.calculate_planet_position(jd, body_id)
+            return ((target_longitude - lon + 540.0) % 360.0) - 180.0
+
+        # Bracket a sign change in 6-hour steps
+        lo = jd_center - 2.0
+        hi = lo + 0.25
+        f_lo = signed_delta(lo)
+        while hi <= jd_center + 2.0:
+            f_hi = signed_delta(hi)
+            if f_lo * f_hi <= 0:
+                break
+            lo, f_lo = hi, f_hi
+            hi += 0.25
+        else:
+            # No crossing in window - return best endpoint
+            return ephemeris.julian_to_datetime(jd_center)
+
+        # Bisect down to precision
+        for _ in range(50):
+            mid = (lo + hi) / 2
+            f_mid = signed_delta(mid)
+            if abs(f_mid) < precision:
+                return ephemeris.julian_to_datetime(mid)
+            if f_lo * f_mid <= 0:
+                hi = mid
+            else:
+                lo, f_lo = mid, f_mid
+
+        return ephemeris.julian_to_datetime((lo + hi) / 2)
 
 
 # Global calculator instance
@@ -3,10 +3,18 @@ Celestial Bodies Mapping
 Maps configuration body names to Swiss Ephemeris constants
 """
 
+import functools
+
+import numpy as np
 import swisseph as swe
 from typing import Dict, List
 from app.core.config_loader import config_loader
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
 
 # Swiss Ephemeris ID mapping
 CELESTIAL_BODY_MAP = {
@@ -69,10 +77,15 @@ ZODIAC_SYMBOLS = [
     "♎", "♏", "♐", "♑", "♒", "♓"
 ]
 
+# Array versions for vectorized sign lookups
+ZODIAC_SIGNS_ARR = np.array(ZODIAC_SIGNS)
+ZODIAC_SYMBOLS_ARR = np.array(ZODIAC_SYMBOLS)
 
+
+@functools.lru_cache(maxsize=1)
 def get_celestial_bodies_to_calculate() -> Dict[str, int]:
     """
-    Get all celestial bodies to calculate from config
+    Get all celestial bodies to calculate from config (cached per process)
 
     Returns:
         Dictionary mapping body name to Swiss Ephemeris ID
@@ -80,32 +93,29 @@ def get_celestial_bodies_to_calculate() -> Dict[str, int]:
     config = config_loader.get_celestial_bodies()
     bodies = {}
 
-    # Major planets
-    for body in config.get("major_planets", []):
-        if body in CELESTIAL_BODY_MAP:
-            bodies[body] = CELESTIAL_BODY_MAP[body]
+    for category in ("major_planets", "nodes", "asteroids", "extended_asteroids"):
+        for body in config.get(category, []):
+            if body in CELESTIAL_BODY_MAP:
+                bodies[body] = CELESTIAL_BODY_MAP[body]
 
-    # Nodes
-    for body in config.get("nodes", []):
-        if body in CELESTIAL_BODY_MAP:
-            bodies[body] = CELESTIAL_BODY_MAP[body]
+    return bodies
 
-    # Asteroids
-    for body in config.get("asteroids", []):
-        if body in CELESTIAL_BODY_MAP:
-            bodies[body] = CELESTIAL_BODY_MAP[body]
 
-    # Extended asteroids
-    for body in config.get("extended_asteroids", []):
-        if body in CELESTIAL_BODY_MAP:
-            bodies[body] = CELESTIAL_BODY_MAP[body]
+@functools.lru_cache(maxsize=1)
+def get_celestial_body_items() -> tuple:
+    """
+    Config-enabled bodies as a frozen ((name, swe_id), ...) tuple
 
-    return bodies
+    Iterating this tuple in the per-chart body sweep is cheaper than
+    rebuilding/iterating the dict; frozen once per config load.
+    """
+    return tuple(get_celestial_bodies_to_calculate().items())
 
 
+@functools.lru_cache(maxsize=1)
 def get_calculated_points() -> List[str]:
     """
-    Get calculated points (not from ephemeris)
+    Get calculated points (not from ephemeris, cached per process)
 
     Returns:
         List of calculated point names
@@ -114,9 +124,10 @@ def get_calculated_points() -> List[str]:
     return config.get("calculated_points", [])
 
 
+@functools.lru_cache(maxsize=1)
 def get_fixed_stars() -> List[str]:
     """
-    Get fixed stars if enabled
+    Get fixed stars if enabled (cached per process)
 
     Returns:
         List of fixed star names
@@ -127,6 +138,18 @@ def get_fixed_stars() -> List[str]:
     return []
 
 
+def _clear_body_caches() -> None:
+    """Drop cached config-derived body data (called on config reload)"""
+    get_celestial_bodies_to_calculate.cache_clear()
+    get_celestial_body_items.cache_clear()
+    get_calculated_points.cache_clear()
+    get_fixed_stars.cache_clear()
+    _SIGN_META_CACHE.clear()
+
+
+config_loader.register_invalidation(_clear_body_caches)
+
+
 def longitude_to_sign(longitude: float) -> tuple[str, str, float]:
     """
     Convert ecliptic longitude to zodiac sign
@@ -147,23 +170,93 @@ def longitude_to_sign(longitude: float) -> tuple[str, str, float]:
     )
 
 
-def get_sign_element(sign_name: str) -> str:
-    """Get element for a zodiac sign"""
-    zodiac_config = config_loader.get_zodiac_signs()
+# Sign name -> config entry, built lazily from config (avoids a linear
+# scan of the zodiac list on every element/modality lookup)
+_SIGN_META_CACHE: Dict[str, dict] = {}
 
-    for sign in zodiac_config:
-        if sign["name"] == sign_name:
-            return sign.get("element", "")
 
-    return ""
+def _sign_meta(sign_name: str) -> dict:
+    """Get config metadata for a zodiac sign via cached dict lookup"""
+    if not _SIGN_META_CACHE:
+        for sign in config_loader.get_zodiac_signs():
+            _SIGN_META_CACHE[sign["name"]] = sign
+    return _SIGN_META_CACHE.get(sign_name, {})
 
 
-def get_sign_modality(sign_name: str) -> str:
-    """Get modality for a zodiac sign"""
-    zodiac_config = config_loader.get_zodiac_signs()
+def longitudes_to_signs(longitudes) -> tuple:
+    """
+    Vectorized longitude_to_sign over an array of longitudes
+
+    Args:
+        longitudes: Array-like of ecliptic longitudes (0-360)
+
+    Returns:
+        Tuple of (sign_names, sign_symbols, degrees_in_sign) arrays
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    indices = (lons // 30).astype(np.intp) % 12
+
+    return (
+        ZODIAC_SIGNS_ARR[indices],
+        ZODIAC_SYMBOLS_ARR[indices],
+        lons - indices * 30
+    )
 
-    for sign in zodiac_config:
-        if sign["name"] == sign_name:
-            return sign.get("modality", "")
 
-    return ""
+def _bulk_sign_house_kernel(lons, sorted_cusps, cusp_order):
+    """Sign indices and house numbers for a flat longitude array"""
+    lons = lons % 360.0
+    sign_idx = (lons // 30.0).astype(np.intp) % 12
+    # Greatest cusp <= longitude; -1 wraps to the last (greatest) cusp
+    pos = np.searchsorted(sorted_cusps, lons, side='right') - 1
+    houses = cusp_order[pos] + 1
+
+    return sign_idx, houses
+
+
+if njit is not None:
+    _bulk_sign_house_kernel = njit(cache=True)(_bulk_sign_house_kernel)
+
+
+def bulk_sign_house(longitudes, house_cusps) -> tuple:
+    """
+    Sign indices and houses for a whole batch of longitudes at once
+
+    Designed for time-batched sweeps (e.g. a (T, N) grid of N bodies
+    over T transit steps): the cusps are sorted once and the whole
+    batch is classified in one kernel call, JIT-compiled when numba is
+    installed. Single-chart paths keep using longitudes_to_signs and
+    the scalar house lookup.
+
+    Args:
+        longitudes: Array-like of ecliptic longitudes, any shape
+        house_cusps: List of 12 house cusp longitudes
+
+    Returns:
+        Tuple of (sign_indices, house_numbers) arrays matching the
+        input shape
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+
+    if len(house_cusps) == 13:
+        cusps = house_cusps[1:]
+    else:
+        cusps = house_cusps[:12]
+
+    cusps_arr = np.asarray(cusps, dtype=np.float64)
+    order = np.argsort(cusps_arr)
+    sorted_cusps = cusps_arr[order]
+
+    sign_idx, houses = _bulk_sign_house_kernel(lons.ravel(), sorted_cusps, order)
+
+    return sign_idx.reshape(lons.shape), houses.reshape(lons.shape)
+
+
+def get_sign_element(sign_name: str) -> str:
+    """Get element for a zodiac sign"""
+    return _sign_meta(sign_name).get("element", "")
+
+
+def get_sign_modality(sign_name: str) -> str:
+    """Get modality for a zodiac sign"""
+    return _sign_meta(sign_name).get("modality", "")
@@ -3,21 +3,38 @@ Configuration Loader
 Singleton pattern to load and cache YAML configuration
 """
 
+import pickle
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# C-accelerated SafeLoader when libyaml is available (same semantics,
+# roughly an order of magnitude faster parse)
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoader:
-    """Singleton configuration loader"""
+    """
+    Configuration loader
+
+    The module-level `config_loader` instance is the process-wide
+    loader; everything imports that instead of constructing new ones,
+    so no __new__-level singleton machinery is needed (and the
+    isinstance-check on every instantiation goes away).
+    """
 
-    _instance: Optional['ConfigLoader'] = None
-    _config: Optional[Dict[str, Any]] = None
+    def __init__(self):
+        self._config: Optional[Dict[str, Any]] = None
+        self._invalidation_hooks: list = []
+
+    def register_invalidation(self, hook) -> None:
+        """
+        Register a callback to run when configuration is reloaded
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        Modules that cache derived config data (e.g. body maps) register
+        their cache-clear functions here so reload() invalidates them.
+        """
+        self._invalidation_hooks.append(hook)
 
     def load(self, config_path: str = None) -> Dict[str, Any]:
         """
@@ -36,71 +53,143 @@ class ConfigLoader:
                 backend_root = current_dir.parent.parent
                 config_path = backend_root / "config.yaml"
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+            config_path = Path(config_path)
+            cache_path = config_path.with_suffix(".yaml.pkl")
+
+            # Pickled copy of the parsed config, valid while it is newer
+            # than the YAML source; loading it skips the parse entirely
+            try:
+                if cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+                    with open(cache_path, 'rb') as f:
+                        self._config = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                self._config = None
+
+            if self._config is None:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    self._config = yaml.load(f, Loader=_Loader)
+
+                # Best-effort cache write (read-only filesystems are fine)
+                try:
+                    with open(cache_path, 'wb') as f:
+                        pickle.dump(self._config, f, protocol=5)
+                except OSError:
+                    pass
+
+            self._build_derived()
 
         return self._config
 
+    def _build_derived(self) -> None:
+        """
+        Materialize the frequently-read config sections as attributes
+
+        Getters used to re-walk (and for aspects, re-merge) the nested
+        config dict on every call; building each view once here turns
+        the getters into plain attribute reads.
+        """
+        config = self._config
+
+        self._celestial_bodies = config.get("celestial_bodies", {})
+        aspects_config = config.get("aspects", {})
+        self._aspects = {
+            **aspects_config.get("major", {}),
+            **aspects_config.get("minor", {})
+        }
+        self._orb_multipliers = aspects_config.get("orb_multipliers", {})
+        house_config = config.get("house_systems", {})
+        self._house_system_default = house_config.get("default", "Placidus")
+        self._house_systems = house_config.get("available", {})
+        self._house_codes = {
+            name: data.get("code", "P") if isinstance(data, dict) else data
+            for name, data in self._house_systems.items()
+        }
+        # swe.houses wants bytes; encode each code once here instead of
+        # per chart
+        self._house_codes_bytes = {
+            name: code.encode() for name, code in self._house_codes.items()
+        }
+        self._calculation = config.get("calculation", {})
+        self._zodiac_signs = config.get("zodiac", {}).get("signs", [])
+        self._signs_tuple = tuple(
+            (sign.get("name", ""), sign.get("symbol", ""))
+            for sign in self._zodiac_signs
+        )
+        self._patterns = config.get("patterns", {})
+        self._fixed_stars = self._celestial_bodies.get("fixed_stars", {})
+
     def reload(self, config_path: str = None):
-        """Force reload configuration"""
+        """Force reload configuration and invalidate dependent caches"""
         self._config = None
-        return self.load(config_path)
+        config = self.load(config_path)
+        for hook in self._invalidation_hooks:
+            hook()
+        return config
 
     def get_celestial_bodies(self) -> Dict[str, list]:
         """Get all celestial bodies configuration"""
-        config = self.load()
-        return config.get("celestial_bodies", {})
+        self.load()
+        return self._celestial_bodies
 
     def get_aspects(self) -> Dict[str, dict]:
         """Get all aspect definitions (major + minor)"""
-        config = self.load()
-        aspects_config = config.get("aspects", {})
-        return {
-            **aspects_config.get("major", {}),
-            **aspects_config.get("minor", {})
-        }
+        self.load()
+        return self._aspects
 
     def get_orb_multipliers(self) -> Dict[str, float]:
         """Get orb multipliers for planets"""
-        config = self.load()
-        return config.get("aspects", {}).get("orb_multipliers", {})
+        self.load()
+        return self._orb_multipliers
 
     def get_house_system_default(self) -> str:
         """Get default house system"""
-        config = self.load()
-        return config.get("house_systems", {}).get("default", "Placidus")
+        self.load()
+        return self._house_system_default
 
     def get_house_systems(self) -> Dict[str, dict]:
         """Get available house systems with metadata"""
-        config = self.load()
-        return config.get("house_systems", {}).get("available", {})
+        self.load()
+        return self._house_systems
 
     def get_house_system_codes(self) -> Dict[str, str]:
         """Get house system codes only (name: code mapping)"""
-        systems = self.get_house_systems()
-        return {name: data.get("code", "P") if isinstance(data, dict) else data
-                for name, data in systems.items()}
+        self.load()
+        return self._house_codes
+
+    def get_house_system_codes_bytes(self) -> Dict[str, bytes]:
+        """Get house system codes pre-encoded for swe.houses"""
+        self.load()
+        return self._house_codes_bytes
 
     def get_calculation_settings(self) -> Dict[str, Any]:
         """Get calculation settings"""
-        config = self.load()
-        return config.get("calculation", {})
+        self.load()
+        return self._calculation
 
     def get_zodiac_signs(self) -> list:
         """Get zodiac sign definitions"""
-        config = self.load()
-        return config.get("zodiac", {}).get("signs", [])
+        self.load()
+        return self._zodiac_signs
+
+    def get_sign(self, longitude: float) -> tuple:
+        """
+        Get (name, symbol) for an ecliptic longitude
+
+        One integer divide and a tuple index into the pre-built sign
+        table - no list scan, no dict construction.
+        """
+        self.load()
+        return self._signs_tuple[int(longitude // 30) % 12]
 
     def get_patterns(self) -> Dict[str, dict]:
         """Get aspect pattern definitions"""
-        config = self.load()
-        return config.get("patterns", {})
+        self.load()
+        return self._patterns
 
     def get_fixed_stars(self) -> Dict[str, Any]:
         """Get fixed stars configuration"""
-        config = self.load()
-        celestial = config.get("celestial_bodies", {})
-        return celestial.get("fixed_stars", {})
+        self.load()
+        return self._fixed_stars
 
 
 # Singleton instance
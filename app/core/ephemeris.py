@@ -3,11 +3,99 @@ Swiss Ephemeris Wrapper
 Low-level interface to Swiss Ephemeris calculations
 """
 
+import numpy as np
 import swisseph as swe
 from datetime import datetime
 from typing import Tuple, Optional
 from app.core.config_loader import config_loader
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; scalar fallback below
+    njit = None
+
+# Unix epoch as naive UTC, and its Julian Day, for fast JD conversion
+_EPOCH_DT = datetime(1970, 1, 1)
+_EPOCH_JD = 2440587.5
+
+
+def datetime_to_julian_fast(dt: datetime) -> float:
+    """
+    Convert naive UTC datetime to Julian Day without the swisseph FFI hop
+
+    Pure timedelta arithmetic against the Unix epoch - equivalent to
+    swe.julday to well below a millisecond for Gregorian dates. Used on
+    hot paths (return searches, transit/progression conversions) where
+    the per-call FFI overhead of swe.julday adds up.
+    """
+    return (dt - _EPOCH_DT).total_seconds() / 86400.0 + _EPOCH_JD
+
+
+def build_house_lookup(house_cusps) -> tuple:
+    """
+    Build a reusable binary-search structure for house classification
+
+    Sorts the 12 cusps once and keeps the permutation back to house
+    order. Callers classifying many longitudes against the same chart
+    build this once and pass it to house_of (or index with searchsorted
+    directly) instead of re-sorting per lookup.
+
+    Args:
+        house_cusps: List of 12 (or swisseph-style 13) cusp longitudes
+
+    Returns:
+        Tuple of (sorted_cusps, house_order) arrays
+    """
+    if len(house_cusps) == 13:
+        cusps = house_cusps[1:]
+    else:
+        cusps = house_cusps[:12]
+
+    cusps_arr = np.asarray(cusps, dtype=np.float64)
+    order = np.argsort(cusps_arr)
+
+    return cusps_arr[order], order
+
+
+def _house_of_kernel(longitude: float, sorted_cusps: np.ndarray, order: np.ndarray) -> int:
+    """
+    Scalar house classification against a prebuilt lookup
+
+    A forward scan over 12 sorted cusps: trivially branch-predicted and,
+    when numba is installed, compiled to a native loop that beats the
+    np.searchsorted call overhead for single lookups (the vectorized
+    batch path keeps searchsorted, which wins for arrays).
+    """
+    lon = longitude % 360.0
+    # Greatest cusp <= longitude; -1 wraps to the last (greatest) cusp
+    pos = -1
+    for i in range(sorted_cusps.shape[0]):
+        if sorted_cusps[i] <= lon:
+            pos = i
+        else:
+            break
+
+    return int(order[pos]) + 1
+
+
+if njit is not None:
+    _house_of_kernel = njit(cache=True)(_house_of_kernel)
+
+
+def house_of(longitude: float, lookup: tuple) -> int:
+    """
+    House number (1-12) for one longitude against a prebuilt lookup
+
+    Args:
+        longitude: Ecliptic longitude (0-360)
+        lookup: Result of build_house_lookup
+
+    Returns:
+        House number (1-12)
+    """
+    sorted_cusps, order = lookup
+    return _house_of_kernel(longitude, sorted_cusps, order)
+
 
 class EphemerisEngine:
     """Swiss Ephemeris calculation engine"""
@@ -34,18 +122,17 @@ class EphemerisEngine:
         """
         Convert datetime to Julian Day Number
 
+        Computed with epoch arithmetic (see datetime_to_julian_fast)
+        rather than the swe.julday FFI call; the two agree to well
+        below a millisecond over the supported Gregorian range.
+
         Args:
             dt: Datetime object (assumed UTC)
 
         Returns:
             Julian Day Number
         """
-        return swe.julday(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-        )
+        return datetime_to_julian_fast(dt)
 
     @staticmethod
     def julian_to_datetime(jd: float) -> datetime:
@@ -91,12 +178,50 @@ class EphemerisEngine:
 
         return longitude, latitude, distance, speed
 
+    @staticmethod
+    def calculate_planet_positions(
+        jd: float,
+        planet_ids,
+        flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED,
+        out: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate positions for many bodies at one moment
+
+        Batched form of calculate_planet_position: all results land in
+        one contiguous (N, 4) buffer filled in a single tight loop with
+        the FFI callable bound locally, and the returned component
+        arrays are column views into it (no per-body tuple building or
+        copies). Callers can pass their own preallocated buffer via
+        `out` to reuse it across timestamps.
+
+        Args:
+            jd: Julian Day Number
+            planet_ids: Sequence of Swiss Ephemeris planet constants
+            flags: Calculation flags
+            out: Optional preallocated (len(planet_ids), 4) buffer
+
+        Returns:
+            Tuple of (longitudes, latitudes, distances, speeds) views,
+            one entry per requested body
+        """
+        n = len(planet_ids)
+        if out is None:
+            out = np.empty((n, 4))
+
+        calc_ut = swe.calc_ut
+        for i, planet_id in enumerate(planet_ids):
+            result, ret = calc_ut(jd, planet_id, flags)
+            out[i] = result[:4]
+
+        return out[:, 0], out[:, 1], out[:, 2], out[:, 3]
+
     @staticmethod
     def calculate_houses(
         jd: float,
         latitude: float,
         longitude: float,
-        house_system: str = 'P'
+        house_system: bytes = b'P'
     ) -> Tuple[list, list]:
         """
         Calculate house cusps
@@ -105,14 +230,19 @@ class EphemerisEngine:
             jd: Julian Day Number
             latitude: Observer latitude (-90 to 90)
             longitude: Observer longitude (-180 to 180)
-            house_system: House system code ('P'=Placidus, 'W'=Whole Sign, etc.)
+            house_system: House system code as bytes (b'P'=Placidus,
+                b'W'=Whole Sign, etc.) - pre-encoded by the config
+                loader so no .encode() happens per call
 
         Returns:
             Tuple of (cusps, ascmc)
             - cusps: List of 13 cusp longitudes (index 0 unused, 1-12 are houses)
             - ascmc: [Ascendant, MC, ARMC, Vertex, Equatorial Asc, ...]
         """
-        cusps, ascmc = swe.houses(jd, latitude, longitude, house_system.encode())
+        if isinstance(house_system, str):
+            house_system = house_system.encode()
+
+        cusps, ascmc = swe.houses(jd, latitude, longitude, house_system)
 
         return list(cusps), list(ascmc)
 
@@ -140,6 +270,10 @@ class EphemerisEngine:
         """
         Determine which house a planet is in
 
+        Thin wrapper over build_house_lookup/house_of for one-off
+        lookups; repeated lookups against the same chart should build
+        the lookup once themselves.
+
         Args:
             planet_longitude: Planet's ecliptic longitude (0-360)
             house_cusps: List of 12 house cusp longitudes
@@ -147,30 +281,33 @@ class EphemerisEngine:
         Returns:
             House number (1-12)
         """
-        # Ensure we have 12 cusps (skip index 0 if present)
-        if len(house_cusps) == 13:
-            cusps = house_cusps[1:]
-        else:
-            cusps = house_cusps[:12]
+        return house_of(planet_longitude, build_house_lookup(house_cusps))
 
-        for i in range(12):
-            cusp_current = cusps[i]
-            cusp_next = cusps[(i + 1) % 12]
+    @staticmethod
+    def get_house_positions(planet_longitudes, house_cusps: list) -> np.ndarray:
+        """
+        Determine houses for many longitudes in one vectorized lookup
+
+        Sorts the cusps once and classifies all longitudes with a single
+        binary search (np.searchsorted) instead of a 12-way Python scan
+        per body. Longitudes below the lowest cusp wrap around to the
+        highest cusp (the 12 -> 1 crossing).
 
-            # Handle zodiac wrap-around (360 -> 0)
-            if cusp_next < cusp_current:
-                cusp_next += 360
-                planet_lon = planet_longitude
-                if planet_lon < cusp_current:
-                    planet_lon += 360
-            else:
-                planet_lon = planet_longitude
+        Args:
+            planet_longitudes: Array-like of ecliptic longitudes (0-360)
+            house_cusps: List of 12 house cusp longitudes
+
+        Returns:
+            Array of house numbers (1-12), same length as input
+        """
+        sorted_cusps, order = build_house_lookup(house_cusps)
 
-            if cusp_current <= planet_lon < cusp_next:
-                return i + 1  # House 1-12
+        lons = np.asarray(planet_longitudes, dtype=np.float64) % 360.0
+        # Index of the greatest cusp <= longitude; -1 wraps to the last
+        # (greatest) cusp, which is exactly the circular wrap case
+        pos = np.searchsorted(sorted_cusps, lons, side='right') - 1
 
-        # Fallback to 1st house
-        return 1
+        return order[pos] + 1
 
     @staticmethod
     def calculate_part_of_fortune(
@@ -198,13 +335,37 @@ class EphemerisEngine:
             # Night formula: Asc + Sun - Moon
             pof = asc_lon + sun_lon - moon_lon
 
-        # Normalize to 0-360
-        while pof < 0:
-            pof += 360
-        while pof >= 360:
-            pof -= 360
+        # Python's float modulo already normalizes negatives into [0, 360)
+        return pof % 360.0
 
-        return pof
+    @staticmethod
+    def calculate_part_of_fortune_auto(
+        asc_lon: float,
+        sun_lon: float,
+        moon_lon: float
+    ) -> float:
+        """
+        Calculate Part of Fortune, determining day/night internally
+
+        Fused form of is_day_birth + calculate_part_of_fortune for the
+        chart hot path: one call, one normalization, no intermediate
+        bool round-trip.
+
+        Args:
+            asc_lon: Ascendant longitude
+            sun_lon: Sun longitude
+            moon_lon: Moon longitude
+
+        Returns:
+            Part of Fortune longitude (0-360)
+        """
+        # Same Asc-relative day test as is_day_birth
+        if ((sun_lon - asc_lon) % 360.0) >= 180.0:
+            pof = asc_lon + moon_lon - sun_lon
+        else:
+            pof = asc_lon + sun_lon - moon_lon
+
+        return pof % 360.0
 
     @staticmethod
     def is_day_birth(sun_lon: float, asc_lon: float) -> bool:
@@ -218,15 +379,11 @@ class EphemerisEngine:
         Returns:
             True if day birth (Sun above horizon)
         """
-        # Sun is above horizon if it's between Asc and Desc (roughly)
-        # More accurate: check if Sun is in houses 7-12
-        desc = (asc_lon + 180) % 360
-
-        # Simplified check
-        if asc_lon < desc:
-            return asc_lon <= sun_lon <= desc
-        else:
-            return sun_lon >= asc_lon or sun_lon <= desc
+        # Day = Sun above horizon = Sun in houses 7-12, i.e. on the arc
+        # from the Descendant forward to the Ascendant. In an
+        # Asc-relative frame that is simply rel >= 180: one modulo, one
+        # compare, no branches (and no inverted desc/asc edge cases)
+        return ((sun_lon - asc_lon) % 360.0) >= 180.0
 
 
 # Global instance
@@ -4,17 +4,46 @@ Offline timezone resolution using timezonefinder + zoneinfo
 Handles historical DST rules automatically
 """
 
-from timezonefinder import TimezoneFinder
+from functools import lru_cache
+
+from timezonefinder import TimezoneFinder, TimezoneFinderL
 from zoneinfo import ZoneInfo
 from datetime import datetime
 
 _tf = TimezoneFinder(in_memory=True)  # Singleton, keep in RAM
+_tfl = TimezoneFinderL(in_memory=True)  # Light index, much faster lookups
+
+_UTC = ZoneInfo("UTC")
+
+
+@lru_cache(maxsize=512)
+def _zi(tz_str: str) -> ZoneInfo:
+    """Cached ZoneInfo factory - avoids re-reading tzdata per request"""
+    return ZoneInfo(tz_str)
+
+
+@lru_cache(maxsize=4096)
+def _tz_cached(klat: int, klng: int) -> str:
+    """Timezone lookup keyed by 0.01-degree-quantized coordinates"""
+    lat = klat / 100.0
+    lng = klng / 100.0
+    # Light index first, but only when its shortcut cell maps to a
+    # single zone: unique_timezone_at returns None on ambiguous cells
+    # (border regions, enclaves), where the full finder must decide
+    tz_str = _tfl.unique_timezone_at(lat=lat, lng=lng)
+    if tz_str is None:
+        tz_str = _tf.timezone_at(lat=lat, lng=lng)
+    return tz_str or "UTC"
 
 
 def get_timezone_str(lat: float, lng: float) -> str:
     """
     Get IANA timezone string from coordinates (e.g. 'Europe/Istanbul')
 
+    Lookups are cached on coordinates quantized to 0.01 degrees (~1 km)
+    - far finer than timezone polygon detail, so repeated charts for
+    the same city skip the point-in-polygon work.
+
     Args:
         lat: Latitude (-90 to 90)
         lng: Longitude (-180 to 180)
@@ -22,8 +51,7 @@ def get_timezone_str(lat: float, lng: float) -> str:
     Returns:
         IANA timezone string, falls back to 'UTC' if not found
     """
-    tz_str = _tf.timezone_at(lat=lat, lng=lng)
-    return tz_str or "UTC"
+    return _tz_cached(round(lat * 100), round(lng * 100))
 
 
 def local_to_utc(local_dt: datetime, lat: float, lng: float) -> tuple[datetime, str]:
@@ -40,7 +68,10 @@ def local_to_utc(local_dt: datetime, lat: float, lng: float) -> tuple[datetime,
         utc_datetime is returned as naive (no tzinfo) for Swiss Ephemeris compatibility
     """
     tz_str = get_timezone_str(lat, lng)
-    tz = ZoneInfo(tz_str)
-    aware = local_dt.replace(tzinfo=tz)
-    utc_dt = aware.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+    # Offset on the exact local datetime - historical tzdata has
+    # transitions at arbitrary sub-hour offsets, so no quantized cache
+    # here; the cached ZoneInfo makes utcoffset() a cheap in-memory
+    # bisect anyway. Fold-0 semantics, same as replace(tzinfo=tz).
+    offset = local_dt.replace(tzinfo=_zi(tz_str)).utcoffset()
+    utc_dt = local_dt - offset
     return utc_dt, tz_str
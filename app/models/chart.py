@@ -5,11 +5,17 @@ Pydantic models for chart data structures
 
 from datetime import datetime
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+# Charts are value objects: freezing them lets pydantic skip the
+# per-assignment bookkeeping and makes accidental mutation an error.
+# extra='forbid' rejects unknown keys instead of silently storing them.
+_FROZEN = ConfigDict(frozen=True, validate_assignment=False, extra="forbid")
 
 
 class Location(BaseModel):
     """Geographic location"""
+    model_config = _FROZEN
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
     name: Optional[str] = Field(None, description="Location name (optional)")
@@ -17,6 +23,8 @@ class Location(BaseModel):
 
 class BirthData(BaseModel):
     """Birth/event data"""
+    # Not frozen: the API layer back-fills timezone_str/local_datetime
+    # after the chart is calculated
     datetime_utc: datetime = Field(..., description="UTC datetime")
     location: Location
     julian_day: float = Field(..., description="Julian Day Number")
@@ -26,6 +34,7 @@ class BirthData(BaseModel):
 
 class PlanetPosition(BaseModel):
     """Celestial body position"""
+    model_config = _FROZEN
     name: str = Field(..., description="Planet/body name")
     longitude: float = Field(..., ge=0, lt=360, description="Ecliptic longitude (0-360)")
     latitude: float = Field(..., description="Ecliptic latitude")
@@ -39,9 +48,24 @@ class PlanetPosition(BaseModel):
     house: int = Field(..., ge=1, le=12, description="House position (1-12)")
     retrograde: bool = Field(..., description="Is retrograde?")
 
+    # Rounding is presentational: internal consumers (aspects, returns)
+    # see full ephemeris precision, output is rounded on serialization
+    @field_serializer('longitude', 'latitude')
+    def _round_position(self, value: float) -> float:
+        return round(value, 4)
+
+    @field_serializer('distance', 'speed')
+    def _round_motion(self, value: float) -> float:
+        return round(value, 6)
+
+    @field_serializer('degree')
+    def _round_degree(self, value: float) -> float:
+        return round(value, 2)
+
 
 class Aspect(BaseModel):
     """Aspect between two points"""
+    model_config = _FROZEN
     aspect_type: str = Field(..., description="Aspect name (Trine, Square, etc.)")
     angle: float = Field(..., description="Exact angle of aspect (0, 90, 120, etc.)")
     orb: float = Field(..., ge=0, description="Orb/exactness in degrees")
@@ -53,6 +77,7 @@ class Aspect(BaseModel):
 
 class AspectPair(BaseModel):
     """Aspect between two celestial bodies"""
+    model_config = _FROZEN
     planet1: str = Field(..., description="First planet/body name")
     planet2: str = Field(..., description="Second planet/body name")
     aspect: Aspect
@@ -60,6 +85,7 @@ class AspectPair(BaseModel):
 
 class Pattern(BaseModel):
     """Aspect pattern (Grand Trine, T-Square, etc.)"""
+    model_config = _FROZEN
     pattern_type: str = Field(..., description="Pattern name")
     planets: List[str] = Field(..., description="Planets involved")
     element: Optional[str] = Field(None, description="Element (Fire/Earth/Air/Water)")
@@ -68,6 +94,7 @@ class Pattern(BaseModel):
 
 class HouseData(BaseModel):
     """House system data"""
+    model_config = _FROZEN
     system: str = Field(..., description="House system name")
     cusps: List[float] = Field(..., min_length=12, max_length=12, description="12 house cusps")
     ascendant: float = Field(..., ge=0, lt=360, description="Ascendant (1st house cusp)")
@@ -75,9 +102,14 @@ class HouseData(BaseModel):
     vertex: float = Field(..., ge=0, lt=360, description="Vertex")
     equatorial_ascendant: Optional[float] = Field(None, ge=0, lt=360)
 
+    @field_serializer('ascendant', 'mc', 'vertex', 'equatorial_ascendant')
+    def _round_angle(self, value: Optional[float]) -> Optional[float]:
+        return round(value, 4) if value is not None else None
+
 
 class NatalChart(BaseModel):
     """Complete natal chart"""
+    model_config = _FROZEN
     birth_data: BirthData
     planets: Dict[str, PlanetPosition] = Field(..., description="All planetary positions")
     houses: HouseData
@@ -87,6 +119,7 @@ class NatalChart(BaseModel):
 
 class MultiHouseNatalChart(BaseModel):
     """Natal chart with multiple house systems"""
+    model_config = _FROZEN
     birth_data: BirthData
     planets: Dict[str, PlanetPosition] = Field(..., description="All planetary positions")
     all_houses: Dict[str, HouseData] = Field(..., description="All house systems calculated")
@@ -96,6 +129,7 @@ class MultiHouseNatalChart(BaseModel):
 
 class TransitData(BaseModel):
     """Transit information"""
+    model_config = _FROZEN
     transit_date: datetime
     transit_location: Location
     transit_planets: Dict[str, PlanetPosition]
@@ -104,12 +138,14 @@ class TransitData(BaseModel):
 
 class TransitChart(BaseModel):
     """Transit chart with natal comparison"""
+    model_config = _FROZEN
     natal_chart: NatalChart
     transit_data: TransitData
 
 
 class ProgressedChart(BaseModel):
     """Secondary progressed chart"""
+    model_config = _FROZEN
     natal_chart: NatalChart
     progressed_date: datetime
     progressed_planets: Dict[str, PlanetPosition]
@@ -119,6 +155,7 @@ class ProgressedChart(BaseModel):
 
 class SolarReturnChart(BaseModel):
     """Solar return chart"""
+    model_config = _FROZEN
     natal_chart: NatalChart
     return_year: int
     return_datetime: datetime
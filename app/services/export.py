@@ -3,20 +3,49 @@ Export Service
 Export charts to JSON, Markdown, and AI-ready prompt formats.
 """
 
-import json
-from typing import Dict, Any, Union
+import functools
+import io
+
+import orjson
+from typing import Dict, Any, Optional, Union
 from app.models.chart import (
     NatalChart, TransitChart, MultiHouseNatalChart,
     ProgressedChart, SolarReturnChart
 )
 from app.core.config_loader import config_loader
+from app.core.celestial_bodies import longitude_to_sign, get_sign_element, get_sign_modality
+
+
+@functools.lru_cache(maxsize=1)
+def _json_indent() -> Optional[int]:
+    """JSON indent setting resolved from config once per process"""
+    export_config = config_loader.load().get("export", {}).get("json", {})
+    return export_config.get("indent", 2) if export_config.get("pretty_print", True) else None
+
+
+config_loader.register_invalidation(_json_indent.cache_clear)
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson_options() -> int:
+    """orjson option flags resolved from config once per process
+
+    Datetimes pass through to default=str so output matches the
+    previous json.dumps form; orjson only offers two-space indentation,
+    so any configured indent maps to it when pretty printing is on.
+    """
+    opts = orjson.OPT_PASSTHROUGH_DATETIME
+    if _json_indent() is not None:
+        opts |= orjson.OPT_INDENT_2
+    return opts
+
+
+config_loader.register_invalidation(_orjson_options.cache_clear)
 
 
 def to_json(chart: Union[NatalChart, MultiHouseNatalChart, TransitChart, ProgressedChart, SolarReturnChart]) -> str:
     """Export chart to JSON string"""
-    export_config = config_loader.load().get("export", {}).get("json", {})
-    indent = export_config.get("indent", 2) if export_config.get("pretty_print", True) else None
-    return json.dumps(chart.model_dump(), indent=indent, default=str)
+    return orjson.dumps(chart.model_dump(), default=str, option=_orjson_options()).decode()
 
 
 def _format_position(degree: float) -> str:
@@ -34,153 +63,223 @@ def _motion_label(planet) -> str:
     return "D"
 
 
+# Derived points excluded from the element/modality summary statistics
+_SKIP_SUMMARY = frozenset(("Part_of_Fortune", "South_Node", "Vertex"))
+
+# Summary bucket keys and their zeroed counters; per-call dicts start
+# as .copy() of these instead of rebuilding the literals
+_ELEMENTS = ("Fire", "Earth", "Air", "Water")
+_MODALITIES = ("Cardinal", "Fixed", "Mutable")
+_EL_ZERO = dict.fromkeys(_ELEMENTS, 0)
+_MOD_ZERO = dict.fromkeys(_MODALITIES, 0)
+
+# Planet selections for the AI prompt exporters, built once instead of
+# as literal tuples inside each call
+_AI_PLANET_ORDER = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+_AI_PROGRESSED_ORDER = _AI_PLANET_ORDER[:5]
+
+# Table header + separator rows, prejoined at import so each table
+# opens with a single write instead of two literals per call
+_POS_HEADER = (
+    "| Planet | Sign | Position | House | Motion | Speed |\n"
+    "|--------|------|----------|-------|--------|-------|\n"
+)
+_ASPECT_HEADER = (
+    "| Planet 1 | Aspect | Planet 2 | Orb | Status | Strength | Nature |\n"
+    "|----------|--------|----------|-----|--------|----------|--------|\n"
+)
+_MULTI_CUSP_HEADER = (
+    "| House | Cusp |\n"
+    "|-------|------|\n"
+)
+_CUSP_HEADER = (
+    "| House | Degree | Sign |\n"
+    "|-------|--------|------|\n"
+)
+_TRANSIT_ASPECT_HEADER = (
+    "| Transit | Natal | Aspect | Orb | Status |\n"
+    "|---------|-------|--------|-----|--------|\n"
+)
+_PROG_POS_HEADER = (
+    "| Planet | Natal | Progressed | Movement | Sign |\n"
+    "|--------|-------|------------|----------|------|\n"
+)
+_PROG_ASPECT_HEADER = (
+    "| Progressed | Natal | Aspect | Orb | Status |\n"
+    "|------------|-------|--------|-----|--------|\n"
+)
+_RETURN_POS_HEADER = (
+    "| Planet | Position | Sign | House |\n"
+    "|--------|----------|------|-------|\n"
+)
+_STARS_HEADER = (
+    "| Name | Constellation | Position | Magnitude | Nature | Meaning |\n"
+    "|------|---------------|----------|-----------|--------|---------|\n"
+)
+_CLUSTERS_HEADER = (
+    "| Name | Position | Meaning |\n"
+    "|------|----------|---------|\n"
+)
+_CONJ_HEADER = (
+    "| Planet | Star | Orb | Nature | Meaning |\n"
+    "|--------|------|-----|--------|---------|\n"
+)
+
+
 def to_markdown(chart: Union[NatalChart, MultiHouseNatalChart]) -> str:
     """Export natal chart to structured Markdown"""
-    from app.core.celestial_bodies import longitude_to_sign, get_sign_element, get_sign_modality
-
     is_multi = isinstance(chart, MultiHouseNatalChart)
-    lines = []
+    # One growing buffer instead of a line list + join; every line is
+    # written with its own trailing newline and the final separator is
+    # dropped at the end (join-equivalent output)
+    buf = io.StringIO()
+    w = buf.write
 
     # Birth data
-    lines.append("# Natal Chart Report\n")
-    lines.append(f"- **Date/Time (UTC):** {chart.birth_data.datetime_utc.strftime('%Y-%m-%d %H:%M:%S')}")
+    w("# Natal Chart Report\n\n")
+    w(f"- **Date/Time (UTC):** {chart.birth_data.datetime_utc.strftime('%Y-%m-%d %H:%M:%S')}\n")
     if chart.birth_data.timezone_str:
-        lines.append(f"- **Timezone:** {chart.birth_data.timezone_str}")
+        w(f"- **Timezone:** {chart.birth_data.timezone_str}\n")
     if chart.birth_data.local_datetime:
-        lines.append(f"- **Local Time:** {chart.birth_data.local_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"- **Location:** {chart.birth_data.location.name or 'Unknown'}")
-    lines.append(f"- **Coordinates:** {chart.birth_data.location.latitude:.4f}, {chart.birth_data.location.longitude:.4f}")
+        w(f"- **Local Time:** {chart.birth_data.local_datetime.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"- **Location:** {chart.birth_data.location.name or 'Unknown'}\n")
+    w(f"- **Coordinates:** {chart.birth_data.location.latitude:.4f}, {chart.birth_data.location.longitude:.4f}\n")
     if is_multi:
-        lines.append("- **House Systems:** All (multi-system comparison)")
+        w("- **House Systems:** All (multi-system comparison)\n")
     else:
-        lines.append(f"- **House System:** {chart.houses.system}")
-    lines.append(f"- **Julian Day:** {chart.birth_data.julian_day:.6f}")
-    lines.append("")
-
-    # Planetary positions table
-    lines.append("## Planetary Positions\n")
-    lines.append("| Planet | Sign | Position | House | Motion | Speed |")
-    lines.append("|--------|------|----------|-------|--------|-------|")
+        w(f"- **House System:** {chart.houses.system}\n")
+    w(f"- **Julian Day:** {chart.birth_data.julian_day:.6f}\n")
+    w("\n")
+
+    # Bind the per-row helpers to locals; the loops below call them for
+    # every planet and the LOAD_GLOBAL per call adds up on large charts
+    fmt_pos = _format_position
+    motion = _motion_label
+
+    # Planetary positions table - the single pass over chart.planets:
+    # while writing the rows, also collect the element groupings,
+    # summary counts, and retrograde list used by the later sections
+    elements = {el: [] for el in _ELEMENTS}
+    element_count = _EL_ZERO.copy()
+    modality_count = _MOD_ZERO.copy()
+    total_el = 0
+    total_mod = 0
+    retrogrades = []
+
+    w("## Planetary Positions\n\n")
+    w(_POS_HEADER)
     for name, p in chart.planets.items():
-        lines.append(
-            f"| {p.name} | {p.sign_symbol} {p.sign} | {_format_position(p.degree)} "
-            f"| {p.house} | {_motion_label(p)} | {p.speed:.4f} |"
+        w(
+            f"| {p.name} | {p.sign_symbol} {p.sign} | {fmt_pos(p.degree)} "
+            f"| {p.house} | {motion(p)} | {p.speed:.4f} |\n"
         )
-    lines.append("")
 
-    # Element distribution
-    elements = {"Fire": [], "Earth": [], "Air": [], "Water": []}
-    for name, p in chart.planets.items():
         el = get_sign_element(p.sign)
         if el in elements:
             elements[el].append(name)
+        if p.retrograde:
+            retrogrades.append(p.name)
+        if name not in _SKIP_SUMMARY:
+            if el in element_count:
+                element_count[el] += 1
+                total_el += 1
+            mod = get_sign_modality(p.sign)
+            if mod in modality_count:
+                modality_count[mod] += 1
+                total_mod += 1
+    w("\n")
 
-    lines.append("### Element Distribution\n")
+    # Element distribution
+    w("### Element Distribution\n\n")
     for el, planets_list in elements.items():
         if planets_list:
-            lines.append(f"- **{el}:** {', '.join(planets_list)}")
-    lines.append("")
+            w(f"- **{el}:** {', '.join(planets_list)}\n")
+    w("\n")
 
     # Aspects
-    lines.append("## Aspects\n")
+    w("## Aspects\n\n")
     if chart.aspects:
-        lines.append(f"Total: {len(chart.aspects)}\n")
-        lines.append("| Planet 1 | Aspect | Planet 2 | Orb | Status | Strength | Nature |")
-        lines.append("|----------|--------|----------|-----|--------|----------|--------|")
-        for ap in sorted(chart.aspects, key=lambda x: x.aspect.strength, reverse=True):
+        w(f"Total: {len(chart.aspects)}\n\n")
+        w(_ASPECT_HEADER)
+        # Already strongest-first from find_all_aspects
+        for ap in chart.aspects:
             a = ap.aspect
             status = "Applying" if a.applying else "Separating"
-            lines.append(
+            w(
                 f"| {ap.planet1} | {a.symbol} {a.aspect_type} | {ap.planet2} "
-                f"| {a.orb:.2f} | {status} | {a.strength:.0f}% | {a.nature} |"
+                f"| {a.orb:.2f} | {status} | {a.strength:.0f}% | {a.nature} |\n"
             )
-        lines.append("")
+        w("\n")
     else:
-        lines.append("No major aspects found within orb.\n")
+        w("No major aspects found within orb.\n\n")
 
     # Patterns
     if chart.patterns:
-        lines.append("## Aspect Patterns\n")
+        w("## Aspect Patterns\n\n")
         for pat in chart.patterns:
             planets_str = ", ".join(pat.planets)
             el_str = f" ({pat.element})" if pat.element else ""
-            lines.append(f"- **{pat.pattern_type}**: {planets_str}{el_str} - {pat.strength:.0f}%")
-        lines.append("")
+            w(f"- **{pat.pattern_type}**: {planets_str}{el_str} - {pat.strength:.0f}%\n")
+        w("\n")
 
     # Houses
     if is_multi:
-        lines.append("## House Systems Comparison\n")
+        w("## House Systems Comparison\n\n")
         for sys_name, hd in chart.all_houses.items():
-            lines.append(f"### {sys_name}\n")
-            lines.append(f"ASC: {hd.ascendant:.2f} | MC: {hd.mc:.2f} | Vertex: {hd.vertex:.2f}\n")
-            lines.append("| House | Cusp |")
-            lines.append("|-------|------|")
+            w(f"### {sys_name}\n\n")
+            w(f"ASC: {hd.ascendant:.2f} | MC: {hd.mc:.2f} | Vertex: {hd.vertex:.2f}\n\n")
+            w(_MULTI_CUSP_HEADER)
             for i, cusp in enumerate(hd.cusps, 1):
                 sign, sym, deg = longitude_to_sign(cusp)
-                lines.append(f"| {i} | {cusp:.2f} ({sym} {sign}) |")
-            lines.append("")
+                w(f"| {i} | {cusp:.2f} ({sym} {sign}) |\n")
+            w("\n")
     else:
-        lines.append("## House Cusps\n")
-        lines.append("| House | Degree | Sign |")
-        lines.append("|-------|--------|------|")
+        w("## House Cusps\n\n")
+        w(_CUSP_HEADER)
         for i, cusp in enumerate(chart.houses.cusps, 1):
             sign, sym, deg = longitude_to_sign(cusp)
-            lines.append(f"| {i} | {cusp:.2f} | {sym} {sign} |")
-        lines.append("")
-        lines.append(f"ASC: {chart.houses.ascendant:.2f} | MC: {chart.houses.mc:.2f} | Vertex: {chart.houses.vertex:.2f}")
-        lines.append("")
-
-    # Summary statistics
-    lines.append("## Summary\n")
-    element_count = {"Fire": 0, "Earth": 0, "Air": 0, "Water": 0}
-    modality_count = {"Cardinal": 0, "Fixed": 0, "Mutable": 0}
-    for name, p in chart.planets.items():
-        if name in ("Part_of_Fortune", "South_Node", "Vertex"):
-            continue
-        el = get_sign_element(p.sign)
-        if el in element_count:
-            element_count[el] += 1
-        mod = get_sign_modality(p.sign)
-        if mod in modality_count:
-            modality_count[mod] += 1
+            w(f"| {i} | {cusp:.2f} | {sym} {sign} |\n")
+        w("\n")
+        w(f"ASC: {chart.houses.ascendant:.2f} | MC: {chart.houses.mc:.2f} | Vertex: {chart.houses.vertex:.2f}\n")
+        w("\n")
 
-    total_el = sum(element_count.values()) or 1
-    total_mod = sum(modality_count.values()) or 1
+    # Summary statistics (counts and totals kept in the positions pass)
+    w("## Summary\n\n")
+    total_el = total_el or 1
+    total_mod = total_mod or 1
 
     for el, cnt in element_count.items():
-        lines.append(f"- {el}: {cnt} ({cnt / total_el * 100:.0f}%)")
-    lines.append(f"- Dominant element: {max(element_count, key=element_count.get)}\n")
+        w(f"- {el}: {cnt} ({cnt / total_el * 100:.0f}%)\n")
+    w(f"- Dominant element: {max(element_count, key=element_count.get)}\n\n")
 
     for mod, cnt in modality_count.items():
-        lines.append(f"- {mod}: {cnt} ({cnt / total_mod * 100:.0f}%)")
-    lines.append(f"- Dominant modality: {max(modality_count, key=modality_count.get)}")
+        w(f"- {mod}: {cnt} ({cnt / total_mod * 100:.0f}%)\n")
+    w(f"- Dominant modality: {max(modality_count, key=modality_count.get)}\n")
 
-    retrogrades = [p.name for p in chart.planets.values() if p.retrograde]
     if retrogrades:
-        lines.append(f"\nRetrograde: {', '.join(retrogrades)}")
+        w(f"\nRetrograde: {', '.join(retrogrades)}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
 
 
 def to_transit_markdown(transit_chart: TransitChart) -> str:
     """Export transit chart to Markdown"""
-    lines = [
-        "# Transit Chart Report\n",
-        f"**Transit Date:** {transit_chart.transit_data.transit_date.strftime('%Y-%m-%d %H:%M:%S UTC')}\n",
-        "## Transit-to-Natal Aspects\n",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Transit Chart Report\n\n")
+    w(f"**Transit Date:** {transit_chart.transit_data.transit_date.strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n")
+    w("## Transit-to-Natal Aspects\n\n")
     if transit_chart.transit_data.transit_to_natal_aspects:
-        lines.append("| Transit | Natal | Aspect | Orb | Status |")
-        lines.append("|---------|-------|--------|-----|--------|")
+        w(_TRANSIT_ASPECT_HEADER)
         for ap in transit_chart.transit_data.transit_to_natal_aspects:
             a = ap.aspect
-            lines.append(
+            w(
                 f"| {ap.planet1} | {ap.planet2} | {a.aspect_type} {a.symbol} "
-                f"| {a.orb:.2f} | {'Applying' if a.applying else 'Separating'} |"
+                f"| {a.orb:.2f} | {'Applying' if a.applying else 'Separating'} |\n"
             )
     else:
-        lines.append("No significant transit aspects found.")
-    return "\n".join(lines)
+        w("No significant transit aspects found.\n")
+    return buf.getvalue()[:-1]
 
 
 def to_progression_markdown(progressed_chart: ProgressedChart) -> str:
@@ -188,40 +287,36 @@ def to_progression_markdown(progressed_chart: ProgressedChart) -> str:
     birth_dt = progressed_chart.natal_chart.birth_data.datetime_utc
     years = (progressed_chart.progressed_date - birth_dt).days / 365.25
 
-    lines = [
-        "# Secondary Progression Report\n",
-        f"**Progression Date:** {progressed_chart.progressed_date.strftime('%Y-%m-%d')}",
-        f"**Years from birth:** {years:.1f}\n",
-        "## Progressed Positions\n",
-        "| Planet | Natal | Progressed | Movement | Sign |",
-        "|--------|-------|------------|----------|------|",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Secondary Progression Report\n\n")
+    w(f"**Progression Date:** {progressed_chart.progressed_date.strftime('%Y-%m-%d')}\n")
+    w(f"**Years from birth:** {years:.1f}\n\n")
+    w("## Progressed Positions\n\n")
+    w(_PROG_POS_HEADER)
     for name, prog in progressed_chart.progressed_planets.items():
         if name in progressed_chart.natal_chart.planets:
             natal = progressed_chart.natal_chart.planets[name]
+            # Branchless wrap into [-180, 180)
             movement = prog.longitude - natal.longitude
-            if movement > 180:
-                movement -= 360
-            elif movement < -180:
-                movement += 360
-            lines.append(
+            movement = ((movement + 180.0) % 360.0) - 180.0
+            w(
                 f"| {name} | {natal.longitude:.2f} | {prog.longitude:.2f} "
-                f"| {movement:+.2f} | {prog.sign_symbol} {prog.sign} |"
+                f"| {movement:+.2f} | {prog.sign_symbol} {prog.sign} |\n"
             )
 
-    lines.append("\n## Progressed-to-Natal Aspects\n")
+    w("\n## Progressed-to-Natal Aspects\n\n")
     if progressed_chart.progressed_to_natal_aspects:
-        lines.append("| Progressed | Natal | Aspect | Orb | Status |")
-        lines.append("|------------|-------|--------|-----|--------|")
+        w(_PROG_ASPECT_HEADER)
         for ap in progressed_chart.progressed_to_natal_aspects:
             a = ap.aspect
-            lines.append(
+            w(
                 f"| {ap.planet1} | {ap.planet2} | {a.aspect_type} {a.symbol} "
-                f"| {a.orb:.2f} | {'Applying' if a.applying else 'Separating'} |"
+                f"| {a.orb:.2f} | {'Applying' if a.applying else 'Separating'} |\n"
             )
     else:
-        lines.append("No significant progressed aspects found.")
-    return "\n".join(lines)
+        w("No significant progressed aspects found.\n")
+    return buf.getvalue()[:-1]
 
 
 def to_solar_return_markdown(solar_return: SolarReturnChart) -> str:
@@ -231,22 +326,21 @@ def to_solar_return_markdown(solar_return: SolarReturnChart) -> str:
     is_lunar = abs(years_diff - round(years_diff)) >= 0.1
     chart_type = "Lunar" if is_lunar else "Solar"
 
-    lines = [
-        f"# {chart_type} Return Chart Report\n",
-        f"**Year:** {solar_return.return_year}",
-        f"**Exact Return:** {solar_return.return_datetime.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-        f"**Location:** {solar_return.return_location.name or 'Coordinates provided'}\n",
-        "## Return Chart Planets\n",
-        "| Planet | Position | Sign | House |",
-        "|--------|----------|------|-------|",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {chart_type} Return Chart Report\n\n")
+    w(f"**Year:** {solar_return.return_year}\n")
+    w(f"**Exact Return:** {solar_return.return_datetime.strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    w(f"**Location:** {solar_return.return_location.name or 'Coordinates provided'}\n\n")
+    w("## Return Chart Planets\n\n")
+    w(_RETURN_POS_HEADER)
     for name, p in solar_return.return_planets.items():
-        lines.append(
-            f"| {p.name} | {_format_position(p.degree)} | {p.sign_symbol} {p.sign} | {p.house} |"
+        w(
+            f"| {p.name} | {_format_position(p.degree)} | {p.sign_symbol} {p.sign} | {p.house} |\n"
         )
 
-    lines.append(f"\n**ASC:** {solar_return.return_houses.ascendant:.2f} | **MC:** {solar_return.return_houses.mc:.2f}")
-    return "\n".join(lines)
+    w(f"\n**ASC:** {solar_return.return_houses.ascendant:.2f} | **MC:** {solar_return.return_houses.mc:.2f}\n")
+    return buf.getvalue()[:-1]
 
 
 def to_ai_prompt(chart: Union[NatalChart, MultiHouseNatalChart]) -> str:
@@ -263,11 +357,11 @@ def to_ai_prompt(chart: Union[NatalChart, MultiHouseNatalChart]) -> str:
         parts.append(f"- House System: {chart.houses.system}\n")
 
     parts.append("Key Planetary Positions:")
-    for name in ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"):
-        if name in chart.planets:
-            p = chart.planets[name]
-            retro = " (R)" if p.retrograde else ""
-            parts.append(f"- {name}: {p.degree:.1f} {p.sign}, House {p.house}{retro}")
+    parts.extend(
+        f"- {name}: {p.degree:.1f} {p.sign}, House {p.house}{' (R)' if p.retrograde else ''}"
+        for name in _AI_PLANET_ORDER
+        if (p := chart.planets.get(name)) is not None
+    )
 
     parts.append("\nMajor Aspects:")
     for ap in chart.aspects[:10]:
@@ -311,12 +405,15 @@ def to_progression_ai_prompt(progressed_chart: ProgressedChart) -> str:
         f"Age: {years:.1f} years\n",
         "Natal vs Progressed:",
     ]
-    for name in ("Sun", "Moon", "Mercury", "Venus", "Mars"):
-        if name in progressed_chart.progressed_planets and name in progressed_chart.natal_chart.planets:
-            prog = progressed_chart.progressed_planets[name]
-            natal = progressed_chart.natal_chart.planets[name]
-            sign_change = " NEW SIGN" if prog.sign != natal.sign else ""
-            parts.append(f"- {name}: {natal.degree:.1f} {natal.sign} -> {prog.degree:.1f} {prog.sign}{sign_change}")
+    progressed = progressed_chart.progressed_planets
+    natal_planets = progressed_chart.natal_chart.planets
+    parts.extend(
+        f"- {name}: {natal.degree:.1f} {natal.sign} -> {prog.degree:.1f} {prog.sign}"
+        f"{' NEW SIGN' if prog.sign != natal.sign else ''}"
+        for name in _AI_PROGRESSED_ORDER
+        if (prog := progressed.get(name)) is not None
+        and (natal := natal_planets.get(name)) is not None
+    )
 
     parts.append("\nAnalyze: 1) Internal development 2) Sign changes 3) Long-term themes 4) Maturation")
     return "\n".join(parts)
@@ -336,11 +433,11 @@ def to_solar_return_ai_prompt(solar_return: SolarReturnChart) -> str:
         f"ASC: {solar_return.return_houses.ascendant:.1f} | MC: {solar_return.return_houses.mc:.1f}\n",
         "Return Planets:",
     ]
-    for name in ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"):
-        if name in solar_return.return_planets:
-            p = solar_return.return_planets[name]
-            retro = " (R)" if p.retrograde else ""
-            parts.append(f"- {name}: {p.degree:.1f} {p.sign}, House {p.house}{retro}")
+    parts.extend(
+        f"- {name}: {p.degree:.1f} {p.sign}, House {p.house}{' (R)' if p.retrograde else ''}"
+        for name in _AI_PLANET_ORDER
+        if (p := solar_return.return_planets.get(name)) is not None
+    )
 
     angular = [f"{n} (H{p.house})" for n, p in solar_return.return_planets.items() if p.house in (1, 4, 7, 10)]
     if angular:
@@ -352,53 +449,50 @@ def to_solar_return_ai_prompt(solar_return: SolarReturnChart) -> str:
 
 def to_fixed_stars_json(fixed_stars_data: Dict[str, Any]) -> str:
     """Export fixed stars data to JSON"""
-    export_config = config_loader.load().get("export", {}).get("json", {})
-    indent = export_config.get("indent", 2) if export_config.get("pretty_print", True) else None
-    return json.dumps(fixed_stars_data, indent=indent, default=str)
+    return orjson.dumps(fixed_stars_data, default=str, option=_orjson_options()).decode()
 
 
 def to_fixed_stars_markdown(fixed_stars_data: Dict[str, Any]) -> str:
     """Export fixed stars data to Markdown"""
-    lines = ["# Fixed Stars Report\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Fixed Stars Report\n\n")
 
     if "calculation_date" in fixed_stars_data:
-        lines.append(f"**Calculation Date:** {fixed_stars_data['calculation_date']}\n")
+        w(f"**Calculation Date:** {fixed_stars_data['calculation_date']}\n\n")
 
     stars = fixed_stars_data.get("stars", [])
     if stars:
-        lines.append(f"## Major Fixed Stars ({len(stars)})\n")
-        lines.append("| Name | Constellation | Position | Magnitude | Nature | Meaning |")
-        lines.append("|------|---------------|----------|-----------|--------|---------|")
+        w(f"## Major Fixed Stars ({len(stars)})\n\n")
+        w(_STARS_HEADER)
         for s in stars:
-            lines.append(
+            w(
                 f"| {s['traditional_name']} | {s['constellation']} | {s['sign']} {s['degree']:.2f} "
-                f"| {s['magnitude']} | {s['nature']} | {s['meaning']} |"
+                f"| {s['magnitude']} | {s['nature']} | {s['meaning']} |\n"
             )
-        lines.append("")
+        w("\n")
 
     clusters = fixed_stars_data.get("clusters", [])
     if clusters:
-        lines.append(f"## Star Clusters ({len(clusters)})\n")
-        lines.append("| Name | Position | Meaning |")
-        lines.append("|------|----------|---------|")
+        w(f"## Star Clusters ({len(clusters)})\n\n")
+        w(_CLUSTERS_HEADER)
         for c in clusters:
-            lines.append(f"| {c['name']} | {c['sign']} {c['degree']:.2f} | {c['meaning']} |")
-        lines.append("")
+            w(f"| {c['name']} | {c['sign']} {c['degree']:.2f} | {c['meaning']} |\n")
+        w("\n")
 
     conjunctions = fixed_stars_data.get("conjunctions", [])
     if conjunctions:
-        lines.append(f"## Star-Planet Conjunctions ({len(conjunctions)})\n")
-        lines.append("| Planet | Star | Orb | Nature | Meaning |")
-        lines.append("|--------|------|-----|--------|---------|")
+        w(f"## Star-Planet Conjunctions ({len(conjunctions)})\n\n")
+        w(_CONJ_HEADER)
         for c in conjunctions:
-            lines.append(
+            w(
                 f"| {c['planet']} | {c['star_traditional_name']} | {c['orb']:.2f} "
-                f"| {c['star_nature']} | {c['star_meaning']} |"
+                f"| {c['star_nature']} | {c['star_meaning']} |\n"
             )
     else:
-        lines.append("## Star-Planet Conjunctions\n\nNo significant conjunctions within orb.")
+        w("## Star-Planet Conjunctions\n\nNo significant conjunctions within orb.\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
 
 
 def to_fixed_stars_ai_prompt(fixed_stars_data: Dict[str, Any]) -> str: